@@ -1,8 +1,14 @@
-# Base URL
-TEST_APP_URL = "https://the-internet.herokuapp.com"
+import os
+
+# Base URL (can be overridden, e.g. to point at the local stand-in server)
+TEST_APP_URL = os.environ.get("TEST_APP_URL", "https://the-internet.herokuapp.com")
 
 # Configuration
 DEFAULT_CONFIGURATION_FILE = "configs/test_data/configuration.json"
 
 # Browser settings
 DEFAULT_VIEWPORT_SIZE = {"width": 1920, "height": 1080}
+
+# Visual assertions
+VISUAL_BASELINE_DIR = "configs/test_data/visual_baselines"
+VISUAL_DIFF_DIR = "logs/visual_diffs"
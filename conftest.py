@@ -1,65 +1,118 @@
 import logging
-from enum import Enum
 from pathlib import Path
+from typing import Callable, Dict
 
 import pytest
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Browser as PlaywrightBrowser, BrowserContext, Playwright, sync_playwright
 
 from configs.settings import DEFAULT_CONFIGURATION_FILE
+from framework.api.api_client import ApiClient
 from framework.logger import logger
 from framework.ui.browser.browser import Browser
 from framework.ui.browser.window import DEFAULT_VIEWPORT_SIZE
+from framework.ui.constants.browsers import BrowserType
 from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.elements.helpers.locator_profiler import LocatorProfiler, format_locator_report
 
-PROJECT_ROOT_DIR = Path(__file__).parent.resolve()
-
+pytest_plugins = [
+    "framework.plugins.browser_matrix",
+    "framework.plugins.local_app",
+    "framework.plugins.memory_monitor",
+]
 
-class BrowserType(Enum):
-    CHROMIUM = "chromium"
-    FIREFOX = "firefox"
-    WEBKIT = "webkit"
+PROJECT_ROOT_DIR = Path(__file__).parent.resolve()
 
 
-def _get_browser(playwright: sync_playwright, browser_type: BrowserType, headless: bool = False) -> Browser:
+def _launch_browser(playwright: Playwright, browser_type: BrowserType, headless: bool = False) -> PlaywrightBrowser:
     browser_map = {
         BrowserType.FIREFOX: playwright.firefox,
         BrowserType.WEBKIT: playwright.webkit,
         BrowserType.CHROMIUM: playwright.chromium
     }
     browser = browser_map.get(browser_type, playwright.chromium)
-    browser_instance = browser.launch(headless=headless)
+    return browser.launch(headless=headless)
+
+
+def _new_context(browser_instance: PlaywrightBrowser) -> BrowserContext:
     context = browser_instance.new_context(viewport=DEFAULT_VIEWPORT_SIZE)
     context.set_default_timeout(WaitTimeoutsMs.WAIT_PAGE_LOAD)
+    return context
 
-    page = context.new_page()
 
-    custom_browser = Browser(page)
+def _new_browser(browser_instance: PlaywrightBrowser) -> Browser:
+    page = _new_context(browser_instance).new_page()
+
+    custom_browser = Browser(page, context_factory=lambda: _new_context(browser_instance))
     return custom_browser
 
 
+def _get_browser(playwright: Playwright, browser_type: BrowserType, headless: bool = False) -> Browser:
+    return _new_browser(_launch_browser(playwright, browser_type, headless))
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption("--browser", action="store", default=BrowserType.CHROMIUM.value,
                      help="Choose a browser: chromium, firefox, webkit")
     parser.addoption("--headless", action="store_true", help="Run browser in headless mode")
     parser.addoption("--config", default=DEFAULT_CONFIGURATION_FILE,
                      help="Path to config file relative to the project root directory")
+    parser.addoption("--locator-report", action="store_true",
+                     help="Time the resolution of every page object locator and report slow ones")
 
 
 @pytest.hookimpl(tryfirst=True)
-def pytest_configure():
+def pytest_configure(config: pytest.Config):
     logger.setup_logger()
     logging.info("Test logging successfully configured for test execution.")
 
+    if config.getoption("--locator-report"):
+        LocatorProfiler.enable()
 
-@pytest.fixture(scope="module")
-def browser(request):
-    browser_channel = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
 
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    if LocatorProfiler.enabled and LocatorProfiler.timings():
+        terminalreporter.write_sep("=", "locator resolution report")
+        terminalreporter.write_line(format_locator_report(LocatorProfiler.timings()))
+
+
+@pytest.fixture(scope="session")
+def playwright_instance() -> Playwright:
     with sync_playwright() as playwright:
-        browser_instance = _get_browser(playwright, BrowserType(browser_channel), headless)
-        yield browser_instance
+        yield playwright
+
+
+@pytest.fixture(scope="session")
+def launch_browser(request, playwright_instance: Playwright) -> Callable[[BrowserType], PlaywrightBrowser]:
+    """Launch each browser engine once per session and reuse it for all modules."""
+    headless = request.config.getoption("--headless")
+    launched: Dict[BrowserType, PlaywrightBrowser] = {}
 
-        # Close the browser after the test is done
-        browser_instance.page.close()
-        browser_instance.page.context.browser.close()
+    def launch(browser_type: BrowserType) -> PlaywrightBrowser:
+        if browser_type not in launched:
+            logging.info(f"Launch '{browser_type.value}' browser")
+            launched[browser_type] = _launch_browser(playwright_instance, browser_type, headless)
+        return launched[browser_type]
+
+    yield launch
+
+    for browser_instance in launched.values():
+        browser_instance.close()
+
+
+@pytest.fixture(scope="module")
+def browser(request, launch_browser):
+    # Parametrized by '--browser-matrix', otherwise taken from '--browser'
+    browser_channel = getattr(request, "param", None) or request.config.getoption("--browser")
+    browser_instance = _new_browser(launch_browser(BrowserType(browser_channel)))
+    yield browser_instance
+
+    # Close the browser context after the module is done
+    browser_instance.page.close()
+    browser_instance.page.context.close()
+
+
+@pytest.fixture
+def api(browser: Browser) -> ApiClient:
+    """API client of the browser context; teardown calls registered by the test run after it."""
+    yield browser.api
+    browser.api.teardown()
@@ -0,0 +1,199 @@
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from playwright.sync_api import BrowserContext
+
+from framework.api.connection_pool import DEFAULT_POOL_SIZE, HttpConnectionPool
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.utils.http_utils import UTF8
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ApiCall:
+    """A single HTTP call for batched execution."""
+    method: str
+    path: str
+    json: Any = None
+    data: Optional[bytes] = None
+    params: Optional[Dict[str, Any]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ApiResponse:
+    """Fully read HTTP response."""
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    elapsed_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(UTF8)
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ApiClient:
+    """
+    HTTP client for test setup and teardown that shares the session with the browser.
+
+    Single requests go through the browser context's Playwright request context, so cookies,
+    extra HTTP headers (e.g. Basic Auth set by `Browser.set_basic_authentication`) and cookies
+    set by the responses are shared with the pages. Parallel batches use a pool of keep-alive
+    connections: the current context cookies are sent with every call and cookies set by the
+    responses are written back into the context.
+
+    **Usage**
+    browser.api.post("/api/users", json={"name": "John"})
+    browser.api.batch([ApiCall("POST", "/api/items", json=item) for item in items], parallel=True)
+    browser.api.add_teardown(ApiCall("DELETE", "/api/users/john"))
+    """
+
+    def __init__(self, context: BrowserContext, base_url: str, extra_headers: Optional[Dict[str, str]] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD):
+        self._context = context
+        self._base_url = base_url.rstrip("/") + "/"
+        self._extra_headers = extra_headers if extra_headers is not None else {}
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._pool: Optional[HttpConnectionPool] = None
+        self._teardown: List[ApiCall] = []
+
+    @property
+    def pool(self) -> HttpConnectionPool:
+        if self._pool is None:
+            self._pool = HttpConnectionPool(self._pool_size, timeout=self._timeout / 1000)
+        return self._pool
+
+    def url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        url = urljoin(self._base_url, path.lstrip("/")) if "://" not in path else path
+        return f"{url}?{urlencode(params, doseq=True)}" if params else url
+
+    def request(self, method: str, path: str, json: Any = None, data: Optional[bytes] = None,
+                params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
+        """
+        Send a request through the browser context's request context.
+
+        :param method: HTTP method.
+        :param path: Path relative to the base URL, or an absolute URL.
+        :param json: JSON-serializable body.
+        :param data: Raw body.
+        :param params: Query string parameters.
+        :param headers: Additional request headers.
+        :return: ApiResponse with the fully read body.
+        """
+        url = self.url(path, params)
+        logger.debug(f"API request: {method} {url}")
+        start = time.perf_counter()
+        response = self._context.request.fetch(url, method=method, headers=headers,
+                                               data=json if json is not None else data, timeout=self._timeout)
+        try:
+            result = ApiResponse(url, response.status, response.headers, response.body(),
+                                 (time.perf_counter() - start) * 1000)
+        finally:
+            response.dispose()
+        logger.debug(f"API response: {method} {url} -> {result.status} in {result.elapsed_ms:.0f} ms")
+        return result
+
+    def get(self, path: str, **kwargs: Any) -> ApiResponse:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> ApiResponse:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> ApiResponse:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> ApiResponse:
+        return self.request("DELETE", path, **kwargs)
+
+    def batch(self, calls: List[ApiCall], parallel: bool = True, max_workers: Optional[int] = None) -> List[ApiResponse]:
+        """
+        Execute several calls, optionally in parallel over pooled keep-alive connections.
+
+        :param calls: Calls to execute.
+        :param parallel: Run the calls concurrently; otherwise they run one by one through the request context.
+        :param max_workers: Maximum number of concurrent calls (defaults to the pool size).
+        :return: Responses in the order of `calls`.
+        """
+        logger.info(f"Execute {len(calls)} API call(s){' in parallel' if parallel else ''}")
+        if not parallel:
+            return [self.request(call.method, call.path, json=call.json, data=call.data, params=call.params,
+                                 headers=call.headers) for call in calls]
+
+        urls = [self.url(call.path, call.params) for call in calls]
+        cookie_headers = {url: self._cookie_header(url) for url in set(urls)}
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_size) as executor:
+            responses = list(executor.map(lambda args: self._pooled_request(*args),
+                                          [(call, url, cookie_headers[url]) for call, url in zip(calls, urls)]))
+        self._store_cookies(responses)
+        return responses
+
+    def add_teardown(self, call: ApiCall) -> None:
+        """Register a call to be executed by `teardown`."""
+        self._teardown.append(call)
+
+    def teardown(self) -> List[ApiResponse]:
+        """Execute all registered teardown calls in parallel and forget them."""
+        calls, self._teardown = self._teardown, []
+        if not calls:
+            return []
+        responses = self.batch(calls, parallel=True)
+        for call, response in zip(calls, responses):
+            if not response.ok:
+                logger.warning(f"Teardown call {call.method} {call.path} failed with status {response.status}")
+        return responses
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+
+    def _pooled_request(self, call: ApiCall, url: str, cookie_header: str) -> ApiResponse:
+        headers = {**self._extra_headers, **call.headers}
+        body = call.data
+        if call.json is not None:
+            body = json.dumps(call.json).encode(UTF8)
+            headers.setdefault("Content-Type", "application/json")
+        if cookie_header:
+            headers["Cookie"] = cookie_header
+
+        start = time.perf_counter()
+        status, response_headers, content = self.pool.request(call.method, url, body=body, headers=headers)
+        response = ApiResponse(url, status, {}, content, (time.perf_counter() - start) * 1000)
+        # Keep repeated Set-Cookie headers, joined like Playwright does
+        for name in set(response_headers.keys()):
+            response.headers[name.lower()] = "\n".join(response_headers.get_all(name))
+        return response
+
+    def _cookie_header(self, url: str) -> str:
+        return "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in self._context.cookies(url))
+
+    def _store_cookies(self, responses: List[ApiResponse]) -> None:
+        cookies = []
+        for response in responses:
+            for header in response.headers.get("set-cookie", "").split("\n"):
+                if not header:
+                    continue
+                parsed = SimpleCookie()
+                parsed.load(header)
+                for name, morsel in parsed.items():
+                    domain = morsel["domain"] or urlsplit(response.url).hostname
+                    cookies.append({"name": name, "value": morsel.value, "domain": domain,
+                                    "path": morsel["path"] or "/"})
+        if cookies:
+            self._context.add_cookies(cookies)
@@ -0,0 +1,109 @@
+import http.client
+import logging
+import queue
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 8
+
+_ConnectionKey = Tuple[str, str, int]
+
+
+class HttpConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections, one bucket per scheme/host/port.
+
+    Connections are reused across requests and threads. A connection is returned to the
+    pool only when its response was fully read and the server did not ask to close it.
+    """
+
+    def __init__(self, max_connections_per_host: int = DEFAULT_POOL_SIZE, timeout: float = 30.0):
+        self._max_connections = max_connections_per_host
+        self._timeout = timeout
+        self._idle: Dict[_ConnectionKey, queue.LifoQueue] = {}
+        self._limits: Dict[_ConnectionKey, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def _key(url: str) -> _ConnectionKey:
+        parts = urlsplit(url)
+        default_port = 443 if parts.scheme == "https" else 80
+        return parts.scheme, parts.hostname, parts.port or default_port
+
+    def _bucket(self, key: _ConnectionKey) -> Tuple[queue.LifoQueue, threading.BoundedSemaphore]:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue()
+                self._limits[key] = threading.BoundedSemaphore(self._max_connections)
+            return self._idle[key], self._limits[key]
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send a request over a pooled connection.
+
+        :param method: HTTP method.
+        :param url: Absolute URL.
+        :param body: Request body.
+        :param headers: Request headers.
+        :return: Status code, response headers and response body.
+        """
+        key = self._key(url)
+        idle, limit = self._bucket(key)
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        with limit:
+            try:
+                connection, reused = idle.get_nowait(), True
+                self.reused += 1
+            except queue.Empty:
+                connection, reused = self._connect(key), False
+
+            try:
+                response, content = self._send(connection, method, target, body, headers)
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
+                # The server dropped the idle keep-alive connection: retry once on a fresh one
+                connection = self._connect(key)
+                try:
+                    response, content = self._send(connection, method, target, body, headers)
+                except (http.client.HTTPException, OSError):
+                    connection.close()
+                    raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                idle.put(connection)
+            return response.status, response.headers, content
+
+    @staticmethod
+    def _send(connection: http.client.HTTPConnection, method: str, target: str, body: Optional[bytes],
+              headers: Optional[Dict[str, str]]) -> Tuple[http.client.HTTPResponse, bytes]:
+        connection.request(method, target, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response, response.read()
+
+    def _connect(self, key: _ConnectionKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.created += 1
+        logger.debug(f"Open pooled connection to {scheme}://{host}:{port}")
+        return connection_cls(host, port, timeout=self._timeout)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            for idle in self._idle.values():
+                while not idle.empty():
+                    idle.get_nowait().close()
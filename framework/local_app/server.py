@@ -0,0 +1,284 @@
+"""
+Local stand-in for the application under test (https://the-internet.herokuapp.com).
+
+Serves the pages targeted by the framework's page objects with the same element ids,
+so the suite and the benchmarks can run hermetically and offline. Run standalone with:
+
+    python -m framework.local_app.server --port 8000 --latency-ms 50
+"""
+import argparse
+import html
+import logging
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from framework.utils.http_utils import UTF8, generate_basic_auth_header
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_USER = "admin"
+DEFAULT_PASSWORD = "admin"
+DEFAULT_TABLE_ROWS = 4
+DEFAULT_DOWNLOAD_SIZE = 1024
+DOWNLOAD_FILES = ["test.txt", "sample.json", "report.csv"]
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>The Internet</title></head>
+<body><div id="content" class="large-12 columns">{body}</div></body></html>"""
+
+ALERTS_BODY = """<div class="example"><h3>JavaScript Alerts</h3>
+<ul>
+<li><button onclick="jsAlert()">Click for JS Alert</button></li>
+<li><button onclick="jsConfirm()">Click for JS Confirm</button></li>
+<li><button onclick="jsPrompt()">Click for JS Prompt</button></li>
+</ul>
+<h4>Result:</h4><p id="result"></p></div>
+<script>
+function log(text) { document.getElementById('result').innerText = text; }
+function jsAlert() { alert('I am a JS Alert'); log('You successfully clicked an alert'); }
+function jsConfirm() { log('You clicked: ' + (confirm('I am a JS Confirm') ? 'Ok' : 'Cancel')); }
+function jsPrompt() { log('You entered: ' + prompt('I am a JS prompt')); }
+</script>"""
+
+CHECKBOXES_BODY = """<div class="example"><h3>Checkboxes</h3>
+<form id="checkboxes">
+<input type="checkbox"> checkbox 1<br>
+<input type="checkbox" checked> checkbox 2
+</form></div>"""
+
+UPLOAD_BODY = """<div class="example"><h3>File Uploader</h3>
+<form method="POST" enctype="multipart/form-data" action="/upload">
+<input id="file-upload" type="file" name="file">
+<input id="file-submit" class="button" type="submit" value="Upload">
+</form></div>"""
+
+UPLOADED_BODY = """<div class="example"><h3>File Uploaded!</h3>
+<div id="uploaded-files" class="panel text-center">{files}</div></div>"""
+
+WINDOWS_BODY = """<div class="example"><h3>Opening a new window</h3>
+<a href="/windows/new" target="_blank">Click Here</a></div>"""
+
+NEW_WINDOW_BODY = """<div class="example"><h3>New Window</h3></div>"""
+
+BASIC_AUTH_BODY = """<div class="example"><h3>Basic Auth</h3>
+<p>Congratulations! You must have the proper credentials.</p></div>"""
+
+TABLE_COLUMNS = ["Last Name", "First Name", "Email", "Due", "Web Site", "Action"]
+TABLE_SEED_ROWS = [
+    ["Smith", "John", "jsmith@gmail.com", "$50.00", "http://www.jsmith.com"],
+    ["Bach", "Frank", "fbach@yahoo.com", "$51.00", "http://www.frank.com"],
+    ["Doe", "Jason", "jdoe@hotmail.com", "$100.00", "http://www.jdoe.com"],
+    ["Conway", "Tim", "tconway@earthlink.net", "$50.00", "http://www.timconway.com"],
+]
+
+
+def generate_table_rows(count: int) -> Iterable[List[str]]:
+    """
+    Generate deterministic table rows; the first rows match the public application.
+
+    :param count: Number of rows to generate.
+    :return: Iterable of row cell values (without the 'Action' column).
+    """
+    for index in range(count):
+        if index < len(TABLE_SEED_ROWS):
+            yield TABLE_SEED_ROWS[index]
+        else:
+            last_name, first_name, _, _, _ = TABLE_SEED_ROWS[index % len(TABLE_SEED_ROWS)]
+            name = f"{first_name[0].lower()}{last_name.lower()}{index}"
+            yield [f"{last_name}{index}", first_name, f"{name}@example.com", f"${index % 500}.00",
+                   f"http://www.{name}.com"]
+
+
+def render_table(table_id: str, rows: int) -> str:
+    header = "".join(f"<th><span>{column}</span></th>" for column in TABLE_COLUMNS)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row)
+        + '<td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>'
+        for row in generate_table_rows(rows)
+    )
+    return f'<table id="{table_id}" class="tablesorter"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def generate_file_content(name: str, size: int) -> Iterable[bytes]:
+    """
+    Generate deterministic file content of the given size in chunks.
+
+    :param name: File name, used as the repeated content pattern.
+    :param size: Size in bytes.
+    :return: Iterable of byte chunks.
+    """
+    pattern = f"{name}\n".encode(UTF8)
+    chunk = (pattern * (STREAM_CHUNK_SIZE // len(pattern) + 1))[:STREAM_CHUNK_SIZE]
+    remaining = size
+    while remaining > 0:
+        yield chunk[:remaining]
+        remaining -= len(chunk)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: 'LocalAppServer'
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"Local app: {format % args}")
+
+    def do_GET(self) -> None:
+        self._dispatch({
+            "/": self._index,
+            "/javascript_alerts": lambda query: self._page(ALERTS_BODY),
+            "/basic_auth": self._basic_auth,
+            "/checkboxes": lambda query: self._page(CHECKBOXES_BODY),
+            "/download": self._download_list,
+            "/tables": self._tables,
+            "/upload": lambda query: self._page(UPLOAD_BODY),
+            "/windows": lambda query: self._page(WINDOWS_BODY),
+            "/windows/new": lambda query: self._page(NEW_WINDOW_BODY),
+        })
+
+    def do_POST(self) -> None:
+        self._dispatch({"/upload": self._upload})
+
+    def _dispatch(self, routes: Dict[str, Callable[[Dict[str, List[str]]], None]]) -> None:
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+
+        delay_ms = self.server.latency_ms + int(query.get("delay_ms", ["0"])[0])
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+        handler = routes.get(parts.path.rstrip("/") or "/")
+        if handler is None and parts.path.startswith("/download/") and self.command == "GET":
+            self._download_file(unquote(parts.path[len("/download/"):]), query)
+        elif handler is None:
+            self._send(HTTPStatus.NOT_FOUND, self._render("<h1>Not Found</h1>"))
+        else:
+            handler(query)
+
+    def _render(self, body: str) -> bytes:
+        return PAGE_TEMPLATE.format(body=body).encode(UTF8)
+
+    def _page(self, body: str) -> None:
+        self._send(HTTPStatus.OK, self._render(body))
+
+    def _send(self, status: HTTPStatus, content: bytes, content_type: str = "text/html; charset=utf-8",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _index(self, query: Dict[str, List[str]]) -> None:
+        links = ["javascript_alerts", "basic_auth", "checkboxes", "download", "tables", "upload", "windows"]
+        items = "".join(f'<li><a href="/{link}">{link}</a></li>' for link in links)
+        self._page(f"<h1>Welcome to the-internet</h1><ul>{items}</ul>")
+
+    def _basic_auth(self, query: Dict[str, List[str]]) -> None:
+        expected = generate_basic_auth_header(self.server.user, self.server.password)
+        if self.headers.get("Authorization") != expected:
+            self._send(HTTPStatus.UNAUTHORIZED, b"Not authorized", "text/plain",
+                       headers={"WWW-Authenticate": 'Basic realm="Restricted Area"'})
+            return
+        self._page(BASIC_AUTH_BODY)
+
+    def _tables(self, query: Dict[str, List[str]]) -> None:
+        rows = int(query.get("rows", [DEFAULT_TABLE_ROWS])[0])
+        self._page(f"<h3>Data Tables</h3>{render_table('table1', rows)}{render_table('table2', rows)}")
+
+    def _download_list(self, query: Dict[str, List[str]]) -> None:
+        files = DOWNLOAD_FILES + self.server.uploaded_files
+        links = "".join(f'<a href="/download/{html.escape(name)}">{html.escape(name)}</a><br>' for name in files)
+        self._page(f'<div class="example"><h3>File Downloader</h3>{links}</div>')
+
+    def _download_file(self, name: str, query: Dict[str, List[str]]) -> None:
+        size = int(query.get("size", [DEFAULT_DOWNLOAD_SIZE])[0])
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Disposition", f'attachment; filename="{name}"')
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        for chunk in generate_file_content(name, size):
+            self.wfile.write(chunk)
+
+    def _upload(self, query: Dict[str, List[str]]) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length)
+        envelope = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode(UTF8)
+        message = BytesParser(policy=default_policy).parsebytes(envelope + payload)
+
+        names = [part.get_filename() for part in message.iter_parts() if part.get_filename()] \
+            if message.is_multipart() else []
+        self.server.uploaded_files.extend(names)
+        self._page(UPLOADED_BODY.format(files="<br>".join(html.escape(name) for name in names)))
+
+
+class LocalAppServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server with the stand-in pages.
+
+    :param host: Interface to bind to.
+    :param port: Port to bind to; 0 picks a free port.
+    :param latency_ms: Latency added to every response (per request use '?delay_ms=').
+    :param user: Basic auth user for '/basic_auth'.
+    :param password: Basic auth password for '/basic_auth'.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = 0, latency_ms: int = 0,
+                 user: str = DEFAULT_USER, password: str = DEFAULT_PASSWORD):
+        super().__init__((host, port), _RequestHandler)
+        self.latency_ms = latency_ms
+        self.user = user
+        self.password = password
+        self.uploaded_files: List[str] = []
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'LocalAppServer':
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="local-app-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Local application server started at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+        logger.info("Local application server stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the local stand-in of the application under test")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = LocalAppServer(args.host, args.port, args.latency_ms)
+    logger.info(f"Serving at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
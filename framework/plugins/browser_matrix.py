@@ -0,0 +1,135 @@
+"""
+Cross-browser matrix execution in a single pytest session.
+
+With '--browser-matrix=chromium,firefox,webkit' (or 'all') the module-scoped `browser`
+fixture is parametrized over the listed engines. Every engine gets one long-lived
+browser process for the session. When pytest-xdist is installed, tests are grouped per
+engine ('--dist loadgroup') and one worker is started per engine unless '-n' is given,
+so the engines run concurrently. A per-engine summary and a merged timing table are
+printed at the end of the session.
+"""
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import pytest
+
+from framework.ui.constants.browsers import BrowserType
+
+ENGINE_PROPERTY = "browser_engine"
+TEST_PROPERTY = "browser_matrix_test"
+ALL_ENGINES = "all"
+SLOWEST_TESTS_IN_REPORT = 10
+
+
+def _parse_engines(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    if value.strip() == ALL_ENGINES:
+        return [browser_type.value for browser_type in BrowserType]
+    engines = [engine.strip() for engine in value.split(",") if engine.strip()]
+    for engine in engines:
+        BrowserType(engine)  # Raises ValueError for unknown engines
+    return engines
+
+
+def _strip_engine_id(nodeid: str, engine: str) -> str:
+    """Remove the engine from the parametrization id, e.g. 'test_a[chromium-1]' -> 'test_a[1]'."""
+    match = re.fullmatch(r"(.*)\[(.*)\]", nodeid)
+    if not match:
+        return nodeid
+    base, param_id = match.groups()
+    remaining = [part for part in param_id.split("-") if part != engine]
+    return f"{base}[{'-'.join(remaining)}]" if remaining else base
+
+
+def _get_property(report: pytest.TestReport, name: str) -> Optional[str]:
+    return next((value for key, value in report.user_properties if key == name), None)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--browser-matrix", action="store", default=None,
+                     help="Run the suite against several engines in one session: "
+                          "comma-separated list of chromium, firefox, webkit or 'all'")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config: pytest.Config) -> None:
+    engines = _parse_engines(config.getoption("--browser-matrix"))
+    if not engines or not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    # One worker per engine by default; tests of an engine stay on the same worker
+    if not getattr(config.option, "numprocesses", None):
+        config.option.numprocesses = len(engines)
+    config.option.dist = "loadgroup"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the same group on one xdist worker")
+    config.pluginmanager.register(EngineReport(_parse_engines(config.getoption("--browser-matrix"))),
+                                  "browser_matrix_report")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    engines = _parse_engines(metafunc.config.getoption("--browser-matrix"))
+    if engines and "browser" in metafunc.fixturenames:
+        metafunc.parametrize("browser", engines, indirect=True, ids=engines, scope="module")
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        engine = callspec.params.get("browser") if callspec else None
+        if engine is None:
+            continue
+        item.add_marker(pytest.mark.xdist_group(name=engine))
+        item.user_properties.append((ENGINE_PROPERTY, engine))
+        item.user_properties.append((TEST_PROPERTY, _strip_engine_id(item.nodeid, engine)))
+
+
+class EngineReport:
+    """Collects per-engine outcomes and durations, also from xdist workers."""
+
+    def __init__(self, engines: List[str]):
+        self._engines = engines
+        self._outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._durations: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        engine = _get_property(report, ENGINE_PROPERTY)
+        if engine is None:
+            return
+
+        self._durations[engine][_get_property(report, TEST_PROPERTY)] += report.duration
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            self._outcomes[engine][report.outcome] += 1
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self._durations:
+            return
+
+        totals = {engine: sum(durations.values()) for engine, durations in self._durations.items()}
+        bottleneck = max(totals, key=totals.get)
+
+        terminalreporter.write_sep("=", "browser matrix summary")
+        terminalreporter.write_line(f"{'engine':<10} {'passed':>7} {'failed':>7} {'skipped':>7} {'total s':>9}")
+        for engine in self._engines:
+            if engine not in totals:
+                continue
+            outcomes = self._outcomes[engine]
+            marker = "  <- bottleneck" if engine == bottleneck and len(totals) > 1 else ""
+            terminalreporter.write_line(f"{engine:<10} {outcomes['passed']:>7} {outcomes['failed']:>7} "
+                                        f"{outcomes['skipped']:>7} {totals[engine]:>9.2f}{marker}")
+
+        engines = [engine for engine in self._engines if engine in totals]
+        tests = {test for durations in self._durations.values() for test in durations}
+        slowest = sorted(tests, key=lambda test: max(self._durations[engine].get(test, 0.0) for engine in engines),
+                         reverse=True)[:SLOWEST_TESTS_IN_REPORT]
+
+        terminalreporter.write_sep("-", f"slowest {len(slowest)} tests per engine (s)")
+        terminalreporter.write_line(" ".join(f"{engine:>9}" for engine in engines) + "  test")
+        for test in slowest:
+            cells = [self._durations[engine].get(test) for engine in engines]
+            row = " ".join(f"{cell:>9.2f}" if cell is not None else f"{'-':>9}" for cell in cells)
+            terminalreporter.write_line(f"{row}  {test}")
@@ -0,0 +1,57 @@
+"""
+Runs the suite against the bundled local stand-in server.
+
+With '--local-app' the server is started on a free port before collection and
+`configs.settings.TEST_APP_URL` (and the 'TEST_APP_URL' environment variable) are pointed at it,
+so tests and benchmarks run hermetically. Tests should take the base URL from the
+`app_url` fixture; the `local_app` fixture always provides a running local server.
+"""
+import os
+from typing import Optional
+
+import pytest
+
+from configs import settings
+from framework.local_app.server import LocalAppServer
+
+_server: Optional[LocalAppServer] = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--local-app", action="store_true",
+                     help="Run against the bundled local stand-in server instead of TEST_APP_URL")
+    parser.addoption("--local-app-latency-ms", type=int, default=0,
+                     help="Latency added by the local stand-in server to every response")
+
+
+def _start_server(config: pytest.Config) -> LocalAppServer:
+    global _server
+    if _server is None:
+        _server = LocalAppServer(latency_ms=config.getoption("--local-app-latency-ms")).start()
+    return _server
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--local-app"):
+        server = _start_server(config)
+        settings.TEST_APP_URL = server.url
+        os.environ["TEST_APP_URL"] = server.url
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    global _server
+    if _server is not None:
+        _server.stop()
+        _server = None
+
+
+@pytest.fixture(scope="session")
+def local_app(request) -> LocalAppServer:
+    """Local stand-in server, started on first use and stopped at the end of the session."""
+    return _start_server(request.config)
+
+
+@pytest.fixture(scope="session")
+def app_url() -> str:
+    """Base URL of the application under test."""
+    return settings.TEST_APP_URL
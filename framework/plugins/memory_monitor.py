@@ -0,0 +1,68 @@
+"""
+Browser memory budget monitoring.
+
+With '--memory-monitor' the memory of the browser is sampled after every test that uses the
+`browser` fixture. The page is recycled when the JS heap exceeds '--max-js-heap-mb' and the
+browser context is recycled when the browser processes exceed '--max-browser-rss-mb'.
+The per-test memory timeline is written to '--memory-timeline' and the tests with the largest
+growth are listed at the end of the session.
+"""
+import pathlib
+from typing import Optional
+
+import pytest
+
+from framework.logger.logger import LOGS_DIRECTORY
+from framework.ui.browser.memory_monitor import (DEFAULT_MAX_BROWSER_RSS_MB, DEFAULT_MAX_JS_HEAP_MB,
+                                                 MemoryMonitor)
+
+TOP_GROWTH_IN_REPORT = 10
+GROWTH_METRICS = {
+    "js_heap_used_mb": "JS heap growth (MB)",
+    "dom_nodes": "DOM node growth",
+    "event_listeners": "event listener growth",
+}
+
+_monitor: Optional[MemoryMonitor] = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("memory", "browser memory monitoring")
+    group.addoption("--memory-monitor", action="store_true",
+                    help="Sample browser memory after each test and recycle the browser when thresholds are crossed")
+    group.addoption("--max-js-heap-mb", type=float, default=DEFAULT_MAX_JS_HEAP_MB,
+                    help="JS heap size after which the page is recycled")
+    group.addoption("--max-browser-rss-mb", type=float, default=DEFAULT_MAX_BROWSER_RSS_MB,
+                    help="Browser processes RSS after which the browser context is recycled")
+    group.addoption("--memory-timeline", default=str(LOGS_DIRECTORY / "memory_timeline.json"),
+                    help="Path of the exported per-test memory timeline")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    global _monitor
+    if config.getoption("--memory-monitor"):
+        _monitor = MemoryMonitor(config.getoption("--max-js-heap-mb"), config.getoption("--max-browser-rss-mb"))
+
+
+@pytest.fixture(autouse=True)
+def _memory_budget(request):
+    yield
+    if _monitor is not None and "browser" in request.fixturenames:
+        _monitor.check(request.getfixturevalue("browser"), request.node.nodeid)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    if _monitor is None or not _monitor.samples:
+        return
+
+    _monitor.export(pathlib.Path(config.getoption("--memory-timeline")))
+    terminalreporter.write_sep("=", "browser memory report")
+    recycled = [sample for sample in _monitor.samples if sample.action]
+    terminalreporter.write_line(f"{len(_monitor.samples)} samples, {len(recycled)} recycle(s), "
+                                f"timeline: {config.getoption('--memory-timeline')}")
+    for metric, title in GROWTH_METRICS.items():
+        growth = _monitor.top_growth(metric, TOP_GROWTH_IN_REPORT)
+        if growth:
+            terminalreporter.write_sep("-", title)
+            for item in growth:
+                terminalreporter.write_line(f"{item['growth']:>10}  {item['test']}")
@@ -1,9 +1,13 @@
 import logging
-from typing import Any, List, Union
+import pathlib
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from playwright.sync_api import Page
+from playwright.sync_api import BrowserContext, Page
 
+from configs import settings
+from framework.api.api_client import ApiClient
 from framework.ui.browser.dialog import DialogHandler
+from framework.ui.browser.network_mocks import MockRegistry
 from framework.ui.browser.window import WindowManager
 from framework.ui.constants.timeouts import WaitTimeoutsMs
 from framework.utils import http_utils
@@ -13,17 +17,35 @@ logger = logging.getLogger(__name__)
 
 class Browser:
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, context_factory: Optional[Callable[[], BrowserContext]] = None):
         self._page = page
+        self._context_factory = context_factory
+        self._mocks: Optional[MockRegistry] = None
+        self._api: Optional[ApiClient] = None
+        self._extra_http_headers: Dict[str, str] = {}
 
     @property
     def page(self) -> Page:
         return self._page
 
+    @property
+    def api(self) -> ApiClient:
+        """HTTP client sharing cookies and auth headers with the browser context, created on first use."""
+        if self._api is None:
+            self._api = ApiClient(self.page.context, settings.TEST_APP_URL, extra_headers=self._extra_http_headers)
+        return self._api
+
     @property
     def dialog(self) -> DialogHandler:
         return DialogHandler(self.page)
 
+    @property
+    def mocks(self) -> MockRegistry:
+        """Request mock registry of the browser context, created on first use."""
+        if self._mocks is None:
+            self._mocks = MockRegistry(self.page.context)
+        return self._mocks
+
     @property
     def window(self) -> WindowManager:
         return WindowManager(self.page)
@@ -51,6 +73,33 @@ class Browser:
         for key in key_list:
             self.page.keyboard.press(key)
 
+    def recycle_page(self) -> None:
+        """Replace the current page with a fresh page in the same browser context."""
+        logger.info("Recycle browser page")
+        old_page = self._page
+        self._page = old_page.context.new_page()
+        old_page.close()
+
+    def recycle_context(self) -> None:
+        """
+        Replace the browser context with a fresh one created by the context factory.
+
+        Cookies, storage and request mocks of the old context are discarded;
+        extra HTTP headers set through this object are applied to the new context.
+        """
+        if self._context_factory is None:
+            raise RuntimeError("Browser context cannot be recycled: no context factory was provided")
+
+        logger.info("Recycle browser context")
+        old_context = self.page.context
+        new_context = self._context_factory()
+        if self._extra_http_headers:
+            new_context.set_extra_http_headers(self._extra_http_headers)
+        self._page = new_context.new_page()
+        self._mocks = None
+        self._api = None
+        old_context.close()
+
     def set_basic_authentication(self, user: str, password: str) -> None:
         """
         Set basic HTTP authentication headers for the current browser context.
@@ -60,7 +109,8 @@ class Browser:
         """
         header = http_utils.generate_basic_auth_header(user, password)
         logger.info("Set basic authentication headers")
-        self.page.context.set_extra_http_headers({"Authorization": header})
+        self._extra_http_headers["Authorization"] = header
+        self.page.context.set_extra_http_headers(self._extra_http_headers)
 
     def take_screenshot(self, screenshot_name: str, is_wait: bool = False, timer: int = None) -> None:
         """
@@ -78,6 +128,30 @@ class Browser:
         except Exception as e:
             logger.error(f"Error taking screenshot: {e}")
 
+    def assert_screenshot(self, name: str, ignore_regions: Optional[List[Dict[str, int]]] = None,
+                          full_page: bool = False, **options: Any) -> None:
+        """
+        Assert that a screenshot of the current page matches its baseline image.
+
+        The screenshot is compared in memory; a diff image is written to `VISUAL_DIFF_DIR` only on mismatch.
+        A missing baseline is created from the screenshot. Requires 'numpy' and 'Pillow'.
+
+        :param name: Baseline name (without extension) in `VISUAL_BASELINE_DIR`.
+        :param ignore_regions: Regions to ignore, as {'x', 'y', 'width', 'height'} in pixels.
+        :param full_page: Take a screenshot of the full scrollable page.
+        :param options: VisualComparator options: tolerance, max_diff_ratio, detect_antialiasing.
+        :raises AssertionError: If the screenshot does not match the baseline.
+        """
+        from framework.ui.visual.visual_compare import VisualComparator
+
+        logger.info(f"Compare screenshot with baseline: {name}")
+        comparator = VisualComparator(pathlib.Path(settings.VISUAL_BASELINE_DIR),
+                                      pathlib.Path(settings.VISUAL_DIFF_DIR), **options)
+        result = comparator.compare(name, self.page.screenshot(full_page=full_page), ignore_regions)
+        if not result.matched:
+            raise AssertionError(f"Screenshot '{name}' does not match the baseline: {result.reason}. "
+                                 f"Diff: '{result.diff_path}'")
+
     def wait_for_delay(self, timeout: int = WaitTimeoutsMs.DEFAULT_DELAY) -> None:
         """Waits for the given `timeout` in milliseconds."""
         logger.debug(f"Waiting for {timeout}ms")
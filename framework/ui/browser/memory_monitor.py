@@ -0,0 +1,165 @@
+import json
+import logging
+import pathlib
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from playwright.sync_api import Page
+
+from framework.ui.browser.browser import Browser
+from framework.ui.constants.browsers import BrowserType
+from framework.utils import proc_utils
+
+logger = logging.getLogger(__name__)
+
+BYTES_IN_MB = 1024 * 1024
+DEFAULT_MAX_JS_HEAP_MB = 512
+DEFAULT_MAX_BROWSER_RSS_MB = 4096
+
+RECYCLE_PAGE = "recycle_page"
+RECYCLE_CONTEXT = "recycle_context"
+
+# Available in Chromium only; other engines return undefined
+JS_PERFORMANCE_MEMORY = """() => performance.memory
+    ? {used: performance.memory.usedJSHeapSize, total: performance.memory.totalJSHeapSize}
+    : null"""
+
+
+@dataclass
+class MemorySample:
+    """Memory usage of the browser after a test."""
+    test: str
+    elapsed_s: float
+    js_heap_used_mb: Optional[float] = None
+    js_heap_total_mb: Optional[float] = None
+    dom_nodes: Optional[int] = None
+    event_listeners: Optional[int] = None
+    browser_rss_mb: Optional[float] = None
+    action: Optional[str] = None
+
+
+def _to_mb(value: Optional[float]) -> Optional[float]:
+    return round(value / BYTES_IN_MB, 2) if value is not None else None
+
+
+def _is_chromium(page: Page) -> bool:
+    browser = page.context.browser
+    return browser is not None and browser.browser_type.name == BrowserType.CHROMIUM.value
+
+
+class MemoryMonitor:
+    """
+    Samples JS heap and browser process memory after each test and recycles the browser when it grows too much.
+
+    On Chromium the JS heap size, DOM node count and event listener count are read through the
+    CDP Performance domain; other engines only report what `performance.memory` exposes (usually nothing).
+    Browser RSS is the total resident memory of the processes started by the test runner,
+    read from /proc (Linux only).
+
+    :param max_js_heap_mb: Recycle the page when the JS heap exceeds this size.
+    :param max_browser_rss_mb: Recycle the browser context when the browser processes exceed this RSS.
+    """
+
+    def __init__(self, max_js_heap_mb: float = DEFAULT_MAX_JS_HEAP_MB,
+                 max_browser_rss_mb: float = DEFAULT_MAX_BROWSER_RSS_MB):
+        self.max_js_heap_mb = max_js_heap_mb
+        self.max_browser_rss_mb = max_browser_rss_mb
+        self._samples: List[MemorySample] = []
+        self._started = time.monotonic()
+
+    @property
+    def samples(self) -> List[MemorySample]:
+        return list(self._samples)
+
+    def sample(self, page: Page, test: str) -> MemorySample:
+        """
+        Take a memory sample of the page and the browser processes.
+
+        :param page: Page to read the JS heap from.
+        :param test: Test id to attach to the sample.
+        :return: MemorySample.
+        """
+        sample = MemorySample(test=test, elapsed_s=round(time.monotonic() - self._started, 3))
+        try:
+            if _is_chromium(page):
+                self._read_cdp_metrics(page, sample)
+            else:
+                heap = page.evaluate(JS_PERFORMANCE_MEMORY)
+                if heap:
+                    sample.js_heap_used_mb = _to_mb(heap["used"])
+                    sample.js_heap_total_mb = _to_mb(heap["total"])
+        except Exception as e:
+            logger.debug(f"JS heap could not be sampled: {e}")
+
+        sample.browser_rss_mb = _to_mb(proc_utils.browser_rss_bytes())
+        return sample
+
+    def check(self, browser: Browser, test: str) -> MemorySample:
+        """
+        Sample memory after a test and recycle the page or context if a threshold is crossed.
+
+        :param browser: Browser used by the test.
+        :param test: Test id.
+        :return: The recorded sample, with the recycling action if one was taken.
+        """
+        sample = self.sample(browser.page, test)
+
+        if sample.browser_rss_mb is not None and sample.browser_rss_mb > self.max_browser_rss_mb:
+            logger.warning(f"Browser RSS {sample.browser_rss_mb} MB exceeds {self.max_browser_rss_mb} MB "
+                           f"after '{test}': recycling browser context")
+            browser.recycle_context()
+            sample.action = RECYCLE_CONTEXT
+        elif sample.js_heap_used_mb is not None and sample.js_heap_used_mb > self.max_js_heap_mb:
+            logger.warning(f"JS heap {sample.js_heap_used_mb} MB exceeds {self.max_js_heap_mb} MB "
+                           f"after '{test}': recycling page")
+            browser.recycle_page()
+            sample.action = RECYCLE_PAGE
+
+        self._samples.append(sample)
+        return sample
+
+    def top_growth(self, metric: str = "js_heap_used_mb", limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return the tests after which the metric grew the most compared to the previous sample.
+
+        Samples following a recycle are skipped, as their baseline was reset.
+
+        :param metric: MemorySample field to compare.
+        :param limit: Maximum number of tests to return.
+        :return: List of {'test', 'growth'} dictionaries, largest growth first.
+        """
+        growth = []
+        for previous, current in zip(self._samples, self._samples[1:]):
+            before, after = getattr(previous, metric), getattr(current, metric)
+            if previous.action is None and before is not None and after is not None and after > before:
+                growth.append({"test": current.test, "growth": round(after - before, 2)})
+        return sorted(growth, key=lambda item: item["growth"], reverse=True)[:limit]
+
+    def export(self, path: pathlib.Path) -> None:
+        """
+        Write the memory timeline as JSON.
+
+        :param path: Output file path.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        timeline = {
+            "thresholds": {"max_js_heap_mb": self.max_js_heap_mb, "max_browser_rss_mb": self.max_browser_rss_mb},
+            "samples": [asdict(sample) for sample in self._samples],
+        }
+        path.write_text(json.dumps(timeline, indent=2))
+        logger.info(f"Memory timeline written to '{path}'")
+
+    @staticmethod
+    def _read_cdp_metrics(page: Page, sample: MemorySample) -> None:
+        session = page.context.new_cdp_session(page)
+        try:
+            session.send("Performance.enable")
+            metrics = {metric["name"]: metric["value"] for metric in session.send("Performance.getMetrics")["metrics"]}
+        finally:
+            session.detach()
+
+        sample.js_heap_used_mb = _to_mb(metrics.get("JSHeapUsedSize"))
+        sample.js_heap_total_mb = _to_mb(metrics.get("JSHeapTotalSize"))
+        sample.dom_nodes = int(metrics["Nodes"]) if "Nodes" in metrics else None
+        sample.event_listeners = int(metrics["JSEventListeners"]) if "JSEventListeners" in metrics else None
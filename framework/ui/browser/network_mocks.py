@@ -0,0 +1,227 @@
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+logger = logging.getLogger(__name__)
+
+ANY = "*"
+ANY_TAIL = "**"
+ROUTE_ALL = "**/*"
+
+QueryPredicate = Union[str, Callable[[Optional[str]], bool]]
+
+
+class MockRule:
+    """A canned response served for requests matching a method, URL pattern and query predicates."""
+
+    def __init__(self, method: str, url_pattern: str, status: int = 200, body: Union[str, bytes, None] = None,
+                 json_body: Any = None, headers: Optional[Dict[str, str]] = None,
+                 query: Optional[Dict[str, QueryPredicate]] = None, latency_ms: int = 0, times: Optional[int] = None):
+        self.method = method.upper()
+        self.url_pattern = url_pattern
+        self.status = status
+        self.headers = dict(headers or {})
+        self.query = dict(query or {})
+        self.latency_ms = latency_ms
+        self.times = times
+        self.hits = 0
+
+        # Bodies are encoded once at registration and served from memory
+        if json_body is not None:
+            self.body = json.dumps(json_body).encode()
+            self.headers.setdefault("content-type", "application/json")
+        elif isinstance(body, str):
+            self.body = body.encode()
+        else:
+            self.body = body or b""
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.times is not None and self.hits >= self.times
+
+    def matches(self, method: str, query: Dict[str, List[str]]) -> bool:
+        """
+        Check the method and query predicates of the rule.
+
+        :param method: Request method.
+        :param query: Parsed query string of the request.
+        :return: True if the rule applies to the request.
+        """
+        if self.is_exhausted or self.method not in (ANY, method):
+            return False
+        for name, expected in self.query.items():
+            value = query.get(name, [None])[0]
+            if callable(expected):
+                if not expected(value):
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"MockRule({self.method} {self.url_pattern} -> {self.status})"
+
+
+class _PathNode:
+    """Node of the path trie: one URL path segment."""
+
+    __slots__ = ("children", "wildcard", "tail_rules", "rules")
+
+    def __init__(self):
+        self.children: Dict[str, '_PathNode'] = {}
+        self.wildcard: Optional['_PathNode'] = None
+        self.tail_rules: List[MockRule] = []
+        self.rules: List[MockRule] = []
+
+
+def _split_path(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def _split_pattern(url_pattern: str) -> Tuple[str, List[str]]:
+    """Split 'https://host/a/*/b' or '*/a/**' into the host and path segments."""
+    if "://" in url_pattern:
+        parts = urlsplit(url_pattern)
+        host, path = parts.netloc, parts.path
+    else:
+        host, _, path = url_pattern.partition("/")
+    return (ANY if host in ("", ANY, ANY_TAIL) else host), _split_path(path)
+
+
+class MockRegistry:
+    """
+    Registry of request mocks served through a single context route.
+
+    Rules are indexed by host and then by a trie of path segments, so a request is matched
+    by walking its own path instead of scanning every registered pattern. In patterns,
+    '*' matches one path segment (or any host) and '**' matches the rest of the path.
+    Method and query predicates are checked only for the rules found in the trie.
+
+    **Usage**
+    browser.mocks.add("GET", "https://api.example.com/users/*", json_body={"name": "John"})
+    browser.mocks.add("POST", "*/api/orders", status=201, latency_ms=300)
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+        self._hosts: Dict[str, _PathNode] = {}
+        self._rules: List[MockRule] = []
+        self._unmatched: List[str] = []
+        self._passed_through = 0
+        self._installed = False
+
+    @property
+    def rules(self) -> List[MockRule]:
+        return list(self._rules)
+
+    @property
+    def unmatched(self) -> List[str]:
+        """Requests to mocked hosts that no rule matched, as 'METHOD url'."""
+        return list(self._unmatched)
+
+    def add(self, method: str, url_pattern: str, **kwargs: Any) -> MockRule:
+        """
+        Register a mock rule.
+
+        :param method: HTTP method or '*' for any method.
+        :param url_pattern: URL pattern, e.g. 'https://host/api/users/*' or '*/api/**'.
+        :param kwargs: MockRule options: status, body, json_body, headers, query, latency_ms, times.
+        :return: The registered rule (its `hits` counter is updated as requests are served).
+        """
+        rule = MockRule(method, url_pattern, **kwargs)
+        host, segments = _split_pattern(url_pattern)
+
+        node = self._hosts.setdefault(host, _PathNode())
+        for index, segment in enumerate(segments):
+            if segment == ANY_TAIL:
+                if index != len(segments) - 1:
+                    raise ValueError(f"'{ANY_TAIL}' is only supported at the end of a pattern: '{url_pattern}'")
+                node.tail_rules.append(rule)
+                break
+            if segment == ANY:
+                node.wildcard = node.wildcard or _PathNode()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _PathNode())
+        else:
+            node.rules.append(rule)
+
+        self._rules.append(rule)
+        logger.debug(f"Register mock {rule}")
+        self._install()
+        return rule
+
+    def clear(self) -> None:
+        """Remove all rules and reset the counters."""
+        self._hosts.clear()
+        self._rules.clear()
+        self._unmatched.clear()
+        self._passed_through = 0
+
+    def find(self, method: str, url: str) -> Optional[MockRule]:
+        """
+        Find the rule that serves the request.
+
+        Exact segments take precedence over '*', which takes precedence over '**';
+        rules with the same pattern are tried in registration order.
+
+        :param method: Request method.
+        :param url: Request URL.
+        :return: Matching rule or None.
+        """
+        parts = urlsplit(url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        segments = _split_path(parts.path)
+        for host in (parts.netloc, ANY):
+            root = self._hosts.get(host)
+            if root is None:
+                continue
+            for rule in self._candidates(root, segments, 0):
+                if rule.matches(method.upper(), query):
+                    return rule
+        return None
+
+    def _candidates(self, node: _PathNode, segments: List[str], index: int) -> Iterator[MockRule]:
+        if index == len(segments):
+            yield from node.rules
+        else:
+            child = node.children.get(segments[index])
+            if child is not None:
+                yield from self._candidates(child, segments, index + 1)
+            if node.wildcard is not None:
+                yield from self._candidates(node.wildcard, segments, index + 1)
+        yield from node.tail_rules
+
+    def report(self) -> Dict[str, Any]:
+        """Return hit counters per rule, requests to mocked hosts that were not matched and the pass-through count."""
+        return {
+            "rules": [{"method": rule.method, "url": rule.url_pattern, "hits": rule.hits} for rule in self._rules],
+            "unused": [f"{rule.method} {rule.url_pattern}" for rule in self._rules if not rule.hits],
+            "unmatched": self.unmatched,
+            "passed_through": self._passed_through,
+        }
+
+    def _install(self) -> None:
+        if not self._installed:
+            self._context.route(ROUTE_ALL, self._handle)
+            self._installed = True
+
+    def _handle(self, route: Route, request: Request) -> None:
+        rule = self.find(request.method, request.url)
+        if rule is None:
+            if urlsplit(request.url).netloc in self._hosts:
+                self._unmatched.append(f"{request.method} {request.url}")
+                logger.warning(f"No mock matched request: {request.method} {request.url}")
+            self._passed_through += 1
+            route.fallback()
+            return
+
+        rule.hits += 1
+        if rule.latency_ms:
+            # Blocks the Playwright dispatcher, so concurrent mocked requests are served one after another
+            time.sleep(rule.latency_ms / 1000)
+        route.fulfill(status=rule.status, headers=rule.headers, body=rule.body)
@@ -1,13 +1,61 @@
 import logging
-from typing import Optional, Dict
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 
 from playwright.sync_api import Page
 
 from configs.settings import DEFAULT_VIEWPORT_SIZE
+from framework.ui.constants.page_events import PageEvent
+from framework.ui.constants.timeouts import WaitTimeoutsMs
 from framework.ui.decorators.decorators import step
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FAN_OUT_TABS = 4
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of loading and checking a single URL in `WindowManager.fan_out`."""
+    url: str
+    ok: bool
+    load_ms: float = 0.0
+    check_ms: float = 0.0
+    value: Any = None
+    error: Optional[str] = None
+
+
+class _FanOutSlot:
+    """A tab in the fan-out pool and the URL it is currently loading."""
+
+    def __init__(self, page: Page):
+        self.index: Optional[int] = None
+        self.started = 0.0
+        self.loaded = False
+        self._attach(page)
+
+    def _attach(self, page: Page) -> None:
+        self.page = page
+        page.on(PageEvent.LOAD.value, self._on_load)
+
+    def _on_load(self, *_: Any) -> None:
+        self.loaded = True
+
+    def replace_tab(self) -> None:
+        """Close a tab that is still loading and continue in a fresh one, so late events cannot leak."""
+        context = self.page.context
+        self.page.close()
+        self._attach(context.new_page())
+
+    def navigate(self, index: int, url: str) -> None:
+        self.index = index
+        self.loaded = False
+        self.started = time.perf_counter()
+        # Start navigation without waiting for it, so the loads of all tabs overlap
+        self.page.evaluate("url => { window.location.href = url; }", url)
+
 
 class WindowManager:
     """Class for browser window operations such as resizing, switching tabs, navigation, etc."""
@@ -68,6 +116,80 @@ class WindowManager:
         logger.debug(f"Total windows count: {len(pages)})")
         self.page = pages[-1]
 
+    @step("Open URLs in up to {max_tabs} parallel tabs")
+    def fan_out(self, urls: Sequence[str], check: Callable[[Page], Any], max_tabs: int = DEFAULT_FAN_OUT_TABS,
+                timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> List[FanOutResult]:
+        """
+        Load URLs concurrently in a bounded pool of tabs and run a check on each loaded page.
+
+        Navigations are started without blocking, so page loads overlap in the browser.
+        The check runs on each tab as soon as its page fires 'load', after which the tab is
+        reused for the next pending URL. All pool tabs are closed at the end; the active
+        page of the manager is not touched.
+
+        :param urls: URLs to open.
+        :param check: Callable receiving the loaded page; its return value is stored in the result.
+                      Raising an exception (including AssertionError) marks the URL as failed.
+        :param max_tabs: Maximum number of tabs open at the same time.
+        :param timeout: Maximum load time per URL in milliseconds.
+        :return: Results in the same order as `urls`.
+        """
+        if max_tabs < 1:
+            raise ValueError(f"max_tabs must be positive, got {max_tabs}")
+
+        context = self.page.context
+        pending: Deque[int] = deque(range(len(urls)))
+        results: List[Optional[FanOutResult]] = [None] * len(urls)
+        slots = [_FanOutSlot(context.new_page()) for _ in range(min(max_tabs, len(urls)))]
+        active: List[_FanOutSlot] = []
+
+        try:
+            for slot in slots:
+                index = pending.popleft()
+                slot.navigate(index, urls[index])
+                active.append(slot)
+
+            while active:
+                for slot in list(active):
+                    load_ms = (time.perf_counter() - slot.started) * 1000
+                    if slot.loaded:
+                        results[slot.index] = self._run_fan_out_check(slot.page, urls[slot.index], check, load_ms)
+                    elif load_ms > timeout:
+                        results[slot.index] = FanOutResult(urls[slot.index], ok=False, load_ms=load_ms,
+                                                           error=f"Page was not loaded within {timeout} ms")
+                        slot.replace_tab()
+                    else:
+                        continue
+
+                    if pending:
+                        next_index = pending.popleft()
+                        slot.navigate(next_index, urls[next_index])
+                    else:
+                        active.remove(slot)
+
+                if active:
+                    # Waiting on any page lets Playwright dispatch the 'load' events of all tabs
+                    active[0].page.wait_for_timeout(WaitTimeoutsMs.EVENT_POLLING_INTERVAL)
+        finally:
+            for slot in slots:
+                slot.page.close()
+
+        failed = [result.url for result in results if not result.ok]
+        logger.info(f"Fan-out finished: {len(urls) - len(failed)}/{len(urls)} URLs passed")
+        return results
+
+    @staticmethod
+    def _run_fan_out_check(page: Page, url: str, check: Callable[[Page], Any], load_ms: float) -> FanOutResult:
+        start = time.perf_counter()
+        try:
+            value = check(page)
+            result = FanOutResult(url, ok=True, load_ms=load_ms, value=value)
+        except Exception as e:
+            result = FanOutResult(url, ok=False, load_ms=load_ms, error=f"{type(e).__name__}: {e}")
+        result.check_ms = (time.perf_counter() - start) * 1000
+        logger.debug(f"Fan-out '{url}': ok={result.ok}, load {load_ms:.0f} ms, check {result.check_ms:.0f} ms")
+        return result
+
     @step("Switch to first window")
     def switch_to_first_window(self) -> None:
         """Switch to the first opened window (tab)."""
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BrowserType(Enum):
+    """Browser engines supported by Playwright."""
+    CHROMIUM = "chromium"
+    FIREFOX = "firefox"
+    WEBKIT = "webkit"
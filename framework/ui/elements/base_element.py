@@ -8,6 +8,8 @@ from framework.ui.constants.elements import ElementType
 from framework.ui.constants.mouse import MouseButton
 from framework.ui.decorators.decorators import action
 from framework.ui.elements.helpers.element_state import ElementStateHandler
+from framework.ui.elements.helpers.locator_compiler import compile_locator
+from framework.ui.elements.helpers.locator_profiler import LocatorProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +29,15 @@ class BaseElement(ABC):
         self._type = element_type
 
         self._locator_input = locator
-        self._locator = locator if isinstance(locator, Locator) else self._page.locator(locator)
+        self._locator = locator if isinstance(locator, Locator) else None
 
     @property
     def locator(self) -> Locator:
-        """Return the resolved Locator instance."""
+        """Return the Locator instance, compiling and resolving a string selector on first access."""
+        if self._locator is None:
+            if LocatorProfiler.enabled:
+                LocatorProfiler.record(self._page, self._locator_input, self._name)
+            self._locator = self._page.locator(compile_locator(self._locator_input))
         return self._locator
 
     @property
@@ -55,7 +61,7 @@ class BaseElement(ABC):
         :return: Locator that can be used for further chaining (e.g. .first, .nth(0), .count()).
         """
         logger.debug(f"Getting child locator by selector: '{selector}'")
-        return self.locator.locator(selector)
+        return self.locator.locator(compile_locator(selector) if isinstance(selector, str) else selector)
 
     def find_all_child_locators(self, selector: Union[Locator, str]) -> List[Locator]:
         """
@@ -165,5 +171,5 @@ class BaseElement(ABC):
             self.locator.click(button=button.value, modifiers=modifier, delay=delay)
 
     def __repr__(self) -> str:
-        str_locator = self._locator_input if isinstance(self._locator_input, str) else self._locator
+        str_locator = self._locator_input if isinstance(self._locator_input, str) else self.locator
         return f"{self._type} '{self._name}' (by Locator: '{str_locator}')"
@@ -0,0 +1,72 @@
+import logging
+from typing import Type, TypeVar
+
+from playwright.sync_api import Locator, Page
+
+from framework.ui.elements.base_element import BaseElement
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseElement)
+
+
+class ElementRef:
+    """
+    Lightweight, slotted reference to a single matched element.
+
+    Used where large numbers of elements are produced at once (e.g. table cells),
+    so that each match costs three slots instead of a full element instance.
+    Use `to_element` to promote a reference to a full element when its API is needed.
+    """
+
+    __slots__ = ("_page", "_locator", "_name")
+
+    def __init__(self, page: Page, locator: Locator, name: str):
+        self._page = page
+        self._locator = locator
+        self._name = name
+
+    @property
+    def locator(self) -> Locator:
+        return self._locator
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def get_attribute(self, attribute_name: str) -> str:
+        """
+        Retrieves the value of a specified attribute from the element.
+
+        :param attribute_name: The name of the attribute to retrieve.
+        :return: The value of the attribute.
+        """
+        logger.debug(f"Get attribute '{attribute_name}' from element: {self}")
+        return self._locator.get_attribute(attribute_name)
+
+    def get_html(self) -> str:
+        """Retrieves the inner HTML of the element."""
+        logger.debug(f"Get HTML from element: {self}")
+        return self._locator.inner_html()
+
+    def get_text(self) -> str:
+        """Retrieves the inner text of the element."""
+        logger.debug(f"Get inner text from element: {self}")
+        return self._locator.inner_text()
+
+    def click(self) -> None:
+        """Performs a left-click on the element."""
+        logger.debug(f"Click on {self}")
+        self._locator.click()
+
+    def to_element(self, element_cls: Type[T]) -> T:
+        """
+        Promote the reference to a full element of the given type.
+
+        :param element_cls: Element class to build (e.g. Label, Button).
+        :return: Element instance wrapping the same locator.
+        """
+        return element_cls(self._page, self._locator, self._name)
+
+    def __repr__(self) -> str:
+        return f"Element reference '{self._name}'"
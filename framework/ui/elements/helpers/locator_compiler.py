@@ -0,0 +1,179 @@
+import logging
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+XPATH_PREFIX = "xpath="
+CSS_PREFIX = "css="
+
+# Name test of a single location step, e.g. 'tr' or '*'
+_STEP_RE = re.compile(r"(\*|[A-Za-z][\w-]*)((?:\[[^\[\]]*\])*)$")
+_PREDICATE_RE = re.compile(r"\[([^\[\]]*)\]")
+_ATTR_VALUE_RE = re.compile(r"""^@([A-Za-z_][\w-]*)\s*=\s*(?:"([^"]*)"|'([^']*)')$""")
+_ATTR_EXISTS_RE = re.compile(r"^@([A-Za-z_][\w-]*)$")
+_INDEX_RE = re.compile(r"^\s*([1-9]\d*)\s*$")
+
+
+def _is_xpath(selector: str) -> bool:
+    """Mirror Playwright's engine detection for XPath selectors."""
+    return selector.startswith(XPATH_PREFIX) or selector.startswith("/") or selector.startswith("./")
+
+
+def _escape_css_string(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _split_steps(xpath: str) -> Optional[List[str]]:
+    """
+    Split an XPath expression into steps and '/' or '//' separators.
+
+    Slashes inside predicates (e.g. attribute values) are not treated as separators.
+
+    :param xpath: XPath expression.
+    :return: List of tokens or None if brackets or quotes are unbalanced.
+    """
+    tokens: List[str] = []
+    current = ""
+    depth = 0
+    quote = None
+    index = 0
+    while index < len(xpath):
+        char = xpath[index]
+        if quote:
+            quote = None if char == quote else quote
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "/" and depth == 0:
+            if current:
+                tokens.append(current)
+                current = ""
+            separator = "//" if xpath.startswith("//", index) else "/"
+            tokens.append(separator)
+            index += len(separator)
+            continue
+        current += char
+        index += 1
+
+    if quote or depth:
+        return None
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+def _convert_step(step: str) -> Optional[str]:
+    """
+    Convert a single XPath location step to a CSS compound selector.
+
+    Only constructs with an exact CSS equivalent are supported: a tag name or '*',
+    attribute presence/equality predicates and a leading positional predicate.
+
+    :param step: XPath step, e.g. 'tr[1][@class="odd"]'.
+    :return: CSS compound selector or None if the step cannot be converted exactly.
+    """
+    match = _STEP_RE.fullmatch(step)
+    if not match:
+        return None
+
+    tag, predicates = match.groups()
+    css = tag
+    for index, predicate in enumerate(_PREDICATE_RE.findall(predicates)):
+        predicate = predicate.strip()
+        position = _INDEX_RE.match(predicate)
+        if position:
+            # A position is only equivalent to CSS when applied before any other filter
+            if index != 0:
+                return None
+            pseudo = "nth-child" if tag == "*" else "nth-of-type"
+            css += f":{pseudo}({position.group(1)})"
+            continue
+
+        attr_value = _ATTR_VALUE_RE.match(predicate)
+        if attr_value:
+            name, double_quoted, single_quoted = attr_value.groups()
+            value = double_quoted if double_quoted is not None else single_quoted
+            css += f'[{name}="{_escape_css_string(value)}"]'
+            continue
+
+        attr_exists = _ATTR_EXISTS_RE.match(predicate)
+        if attr_exists:
+            css += f"[{attr_exists.group(1)}]"
+            continue
+
+        return None
+    return css
+
+
+def _xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Rewrite a simple XPath expression to an equivalent CSS selector.
+
+    Leading '//' and './/' are treated as relative to the scope the selector is queried
+    from, matching how Playwright evaluates XPath inside a parent locator.
+
+    :param xpath: XPath expression without the 'xpath=' prefix.
+    :return: CSS selector or None if the expression is not supported.
+    """
+    if xpath.startswith(".//"):
+        xpath = xpath[1:]
+    elif xpath.startswith("./"):
+        xpath = ":scope" + xpath[1:]
+    elif not xpath.startswith("//"):
+        # Absolute paths from the document root have no scoped CSS equivalent
+        return None
+
+    parts = _split_steps(xpath)
+    if parts is None:
+        return None
+
+    css_parts: List[str] = []
+    for index, part in enumerate(parts):
+        if part == "//":
+            if index:
+                css_parts.append(" ")
+        elif part == "/":
+            css_parts.append(" > ")
+        elif part == ":scope" and index == 0:
+            css_parts.append(part)
+        else:
+            compound = _convert_step(part)
+            if compound is None:
+                return None
+            css_parts.append(compound)
+
+    if not css_parts or css_parts[-1] in (" ", " > "):
+        return None
+    return "".join(css_parts)
+
+
+@lru_cache(maxsize=1024)
+def compile_locator(selector: str) -> str:
+    """
+    Compile a selector to the fastest equivalent Playwright selector.
+
+    Simple XPath expressions (descendant/child axes, tag names, attribute and position
+    predicates) are rewritten to CSS, which is evaluated natively by the browser and
+    stays within the scope of a parent locator. Everything else is returned unchanged.
+    Results are cached per selector string.
+
+    :param selector: CSS, XPath or any other Playwright selector.
+    :return: Compiled selector.
+    """
+    if not _is_xpath(selector):
+        return selector
+
+    xpath = selector[len(XPATH_PREFIX):] if selector.startswith(XPATH_PREFIX) else selector
+    css = _xpath_to_css(xpath.strip())
+    if css is None:
+        logger.debug(f"Locator '{selector}' kept as XPath: no exact CSS equivalent")
+        return selector
+
+    compiled = f"{CSS_PREFIX}{css}"
+    logger.debug(f"Locator '{selector}' compiled to '{compiled}'")
+    return compiled
@@ -0,0 +1,109 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import Page
+
+from framework.ui.elements.helpers.locator_compiler import compile_locator
+
+logger = logging.getLogger(__name__)
+
+SLOW_LOCATOR_THRESHOLD_MS = 50.0
+
+
+@dataclass
+class LocatorTiming:
+    """Resolution timing of a single locator."""
+    name: str
+    selector: str
+    compiled: str
+    matches: int
+    duration_ms: float
+    original_duration_ms: Optional[float] = None
+
+    @property
+    def is_slow(self) -> bool:
+        return self.duration_ms >= SLOW_LOCATOR_THRESHOLD_MS
+
+
+class LocatorProfiler:
+    """
+    Collects in-page resolution times of locators used by page objects.
+
+    Disabled by default. When enabled (see the '--locator-report' option), every distinct
+    selector is timed once on its first resolution and the results are reported at the
+    end of the session, with slow selectors flagged.
+    """
+
+    enabled = False
+    _timings: Dict[Tuple[str, str], LocatorTiming] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.enabled = True
+
+    @classmethod
+    def record(cls, page: Page, selector: str, name: str) -> None:
+        """
+        Time the resolution of the selector once per distinct (name, selector) pair.
+
+        :param page: Page to resolve the selector in.
+        :param selector: Selector as declared in the page object.
+        :param name: Human-readable element name.
+        """
+        if (name, selector) in cls._timings:
+            return
+        timing = profile_locator(page, selector, name)
+        cls._timings[(name, selector)] = timing
+        if timing.is_slow:
+            logger.warning(f"Slow locator '{name}': '{selector}' resolved in {timing.duration_ms:.1f} ms")
+
+    @classmethod
+    def timings(cls) -> List[LocatorTiming]:
+        """Return the recorded timings, slowest first."""
+        return sorted(cls._timings.values(), key=lambda timing: timing.duration_ms, reverse=True)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._timings.clear()
+
+
+def _time_count(page: Page, selector: str) -> Tuple[int, float]:
+    start = time.perf_counter()
+    matches = page.locator(selector).count()
+    return matches, (time.perf_counter() - start) * 1000
+
+
+def profile_locator(page: Page, selector: str, name: Optional[str] = None) -> LocatorTiming:
+    """
+    Measure how long the page takes to resolve the selector.
+
+    If the selector is rewritten by the locator compiler, the original selector is timed
+    as well, so the gain of the rewrite is visible in the report.
+
+    :param page: Page to resolve the selector in.
+    :param selector: Selector to profile.
+    :param name: Human-readable name for the report (defaults to the selector).
+    :return: LocatorTiming with the number of matches and resolution time.
+    """
+    compiled = compile_locator(selector)
+    matches, duration_ms = _time_count(page, compiled)
+    original_duration_ms = _time_count(page, selector)[1] if compiled != selector else None
+    return LocatorTiming(name or selector, selector, compiled, matches, duration_ms, original_duration_ms)
+
+
+def format_locator_report(timings: List[LocatorTiming]) -> str:
+    """
+    Format locator timings as a plain-text table.
+
+    :param timings: Timings to include in the report.
+    :return: Report text.
+    """
+    lines = [f"{'ms':>8}  {'was ms':>8}  {'matches':>7}  {'slow':<4}  locator"]
+    for timing in timings:
+        original = f"{timing.original_duration_ms:8.1f}" if timing.original_duration_ms is not None else f"{'-':>8}"
+        flag = "SLOW" if timing.is_slow else ""
+        lines.append(f"{timing.duration_ms:8.1f}  {original}  {timing.matches:>7}  {flag:<4}  "
+                     f"{timing.name}: {timing.selector} -> {timing.compiled}")
+    return "\n".join(lines)
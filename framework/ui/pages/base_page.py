@@ -1,4 +1,5 @@
 import logging
+from typing import Dict, Optional, Union
 
 from playwright.sync_api import Locator, Page
 
@@ -6,16 +7,36 @@ from framework.ui.constants.elements import WaitForState
 from framework.ui.constants.page_events import PageEvent
 from framework.ui.constants.timeouts import WaitTimeoutsMs
 from framework.ui.elements.base_element import BaseElement
+from framework.ui.elements.helpers.locator_compiler import compile_locator
+from framework.ui.pages.page_registry import PageRegistry
 
 logger = logging.getLogger(__name__)
 
 
 class BasePage:
+    """
+    Base class for page objects.
 
-    def __init__(self, page: Page, element: Locator, name: str):
+    Subclasses that declare `UNIQUE_SELECTOR` are registered in `PageRegistry` and can be
+    detected with `PageRegistry.detect` or asserted with `PageRegistry.expect_page`.
+    """
+
+    UNIQUE_SELECTOR: Optional[str] = None
+    PAGE_NAME: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.UNIQUE_SELECTOR:
+            PageRegistry.register(cls)
+
+    def __init__(self, page: Page, element: Optional[Union[Locator, str]] = None, name: Optional[str] = None):
         self._page = page
-        self._name = name
-        self._unique_element = element
+        self._name = name or self.PAGE_NAME or type(self).__name__
+        self._unique_element = element if element is not None else self.UNIQUE_SELECTOR
+        self._element_cache: Dict[str, BaseElement] = {}
+
+        if self._unique_element is None:
+            raise ValueError(f"Page '{self._name}' has no unique element: pass one or declare UNIQUE_SELECTOR")
 
     @property
     def name(self) -> str:
@@ -28,6 +49,15 @@ class BasePage:
     @page.setter
     def page(self, value: Page) -> None:
         self._page = value
+        # Elements declared with PageElement are bound to the previous page
+        self._element_cache.clear()
+
+    @property
+    def unique_element(self) -> Locator:
+        """Return the Locator of the element identifying the page, resolved against the current page."""
+        if isinstance(self._unique_element, Locator):
+            return self._unique_element
+        return self.page.locator(compile_locator(self._unique_element))
 
     def get_title(self) -> str:
         return self.page.title()
@@ -59,7 +89,7 @@ class BasePage:
     def wait_for_page_to_load(self) -> None:
         logger.debug(f"Waiting for page '{self.name}' to load")
         try:
-            self._unique_element.wait_for(state=WaitForState.VISIBLE.value, timeout=WaitTimeoutsMs.WAIT_PAGE_LOAD)
+            self.unique_element.wait_for(state=WaitForState.VISIBLE.value, timeout=WaitTimeoutsMs.WAIT_PAGE_LOAD)
             logger.debug(f"Page '{self.name}' loaded")
         except Exception as e:
             logger.error(f"Page '{self.name}' was not loaded: {str(e)}")
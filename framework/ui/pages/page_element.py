@@ -0,0 +1,49 @@
+import logging
+from typing import Any, Generic, Optional, Type, TypeVar, Union
+
+from playwright.sync_api import Locator
+
+from framework.ui.elements.base_element import BaseElement
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseElement)
+
+
+class PageElement(Generic[T]):
+    """
+    Descriptor for declaring page object elements at class level.
+
+    The element is built on first access and cached per page object instance.
+    The cache is dropped whenever `BasePage.page` is reassigned, so elements are
+    rebuilt against the new page on next access.
+
+    **Usage**
+    class LoginPage(BasePage):
+        login_button = PageElement(Button, "#login", "Login button")
+    """
+
+    def __init__(self, element_cls: Type[T], locator: Union[Locator, str], name: str, **kwargs: Any):
+        self._element_cls = element_cls
+        self._locator = locator
+        self._name = name
+        self._kwargs = kwargs
+        self._attr_name: Optional[str] = None
+
+    def __set_name__(self, owner: type, attr_name: str) -> None:
+        self._attr_name = attr_name
+
+    def __get__(self, instance: Any, owner: type) -> Union['PageElement[T]', T]:
+        if instance is None:
+            return self
+
+        cache = instance._element_cache
+        element = cache.get(self._attr_name)
+        if element is None:
+            logger.debug(f"Build element '{self._name}' for page '{instance.name}'")
+            element = self._element_cls(instance.page, self._locator, self._name, **self._kwargs)
+            cache[self._attr_name] = element
+        return element
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"Page element '{self._attr_name}' is read-only")
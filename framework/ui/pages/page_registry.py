@@ -0,0 +1,111 @@
+import logging
+import time
+from functools import reduce
+from typing import TYPE_CHECKING, List, Optional, Sequence, Type
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from framework.ui.constants.elements import WaitForState
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.elements.helpers.locator_compiler import compile_locator
+
+if TYPE_CHECKING:
+    from framework.ui.pages.base_page import BasePage
+
+logger = logging.getLogger(__name__)
+
+
+class PageRegistry:
+    """
+    Registry of page object types that declare a `UNIQUE_SELECTOR`.
+
+    Every `BasePage` subclass with a unique selector is registered automatically.
+    The registry can tell which page is currently displayed by racing all candidate
+    selectors in a single in-page wait instead of checking pages one by one.
+    """
+
+    _pages: List[Type['BasePage']] = []
+
+    @classmethod
+    def register(cls, page_cls: Type['BasePage']) -> None:
+        if page_cls not in cls._pages:
+            logger.debug(f"Register page object '{page_cls.__name__}' ({page_cls.UNIQUE_SELECTOR})")
+            cls._pages.append(page_cls)
+
+    @classmethod
+    def unregister(cls, page_cls: Type['BasePage']) -> None:
+        if page_cls in cls._pages:
+            cls._pages.remove(page_cls)
+
+    @classmethod
+    def pages(cls) -> List[Type['BasePage']]:
+        return list(cls._pages)
+
+    @classmethod
+    def detect(cls, page: Page, candidates: Optional[Sequence[Type['BasePage']]] = None,
+               timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> Optional[Type['BasePage']]:
+        """
+        Detect which registered page object is displayed.
+
+        All candidate unique selectors are combined into one locator and awaited together,
+        so the call returns as soon as any candidate page renders.
+
+        :param page: Playwright page to inspect.
+        :param candidates: Page object types to consider (all registered types by default).
+        :param timeout: Maximum time to wait for any candidate in milliseconds.
+        :return: The first candidate type (in registration order) that is displayed, or None.
+        """
+        candidates = list(candidates) if candidates is not None else cls.pages()
+        if not candidates:
+            raise ValueError("No page objects are registered for detection")
+        missing = [page_cls.__name__ for page_cls in candidates if not page_cls.UNIQUE_SELECTOR]
+        if missing:
+            raise ValueError(f"Page objects without UNIQUE_SELECTOR cannot be detected: {missing}")
+
+        locators = [page.locator(compile_locator(page_cls.UNIQUE_SELECTOR)) for page_cls in candidates]
+        combined = reduce(lambda first, second: first.or_(second), locators)
+        logger.debug(f"Detecting current page among {[page_cls.__name__ for page_cls in candidates]}")
+
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            try:
+                combined.first.wait_for(state=WaitForState.VISIBLE.value, timeout=remaining_ms)
+            except PlaywrightTimeoutError:
+                logger.debug(f"None of the candidate pages was displayed within {timeout} ms")
+                return None
+
+            for page_cls, locator in zip(candidates, locators):
+                if locator.first.is_visible():
+                    logger.debug(f"Detected page '{page_cls.__name__}'")
+                    return page_cls
+
+            # The matched element went away between the race and the check
+            if time.monotonic() >= deadline:
+                return None
+
+    @classmethod
+    def expect_page(cls, page: Page, expected: Type['BasePage'],
+                    candidates: Optional[Sequence[Type['BasePage']]] = None,
+                    timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> 'BasePage':
+        """
+        Assert that navigation landed on the expected page object.
+
+        Unlike `BasePage.wait_for_page_to_load`, a wrong page is reported as soon as it renders.
+
+        :param page: Playwright page to inspect.
+        :param expected: Expected page object type.
+        :param candidates: Page object types to consider (all registered types by default).
+        :param timeout: Maximum time to wait for any candidate in milliseconds.
+        :return: Instance of the expected page object bound to the page.
+        :raises AssertionError: If another page or no known page is displayed.
+        """
+        candidates = list(candidates) if candidates is not None else cls.pages()
+        if expected not in candidates:
+            candidates.append(expected)
+
+        detected = cls.detect(page, candidates, timeout)
+        if detected is not expected:
+            landed = detected.__name__ if detected else "no known page"
+            raise AssertionError(f"Expected to be on '{expected.__name__}', but landed on {landed} ({page.url})")
+        return expected(page)
@@ -0,0 +1,218 @@
+import io
+import logging
+import pathlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # Optional dependencies, only required for visual assertions
+    np = None
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 16
+DEFAULT_MAX_DIFF_RATIO = 0.0
+# Hamming distance (out of 64 bits) above which images are considered different without a pixel diff
+PHASH_MISMATCH_DISTANCE = 12
+BASELINE_CACHE_SIZE = 16
+HASH_SIZE = 8
+
+DIFF_COLOR = (255, 0, 0, 255)
+ANTIALIASING_COLOR = (255, 200, 0, 255)
+
+Region = Dict[str, int]
+
+# Offsets of the 8 neighbours of a pixel
+_NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+
+@dataclass
+class VisualDiff:
+    """Result of comparing a screenshot to its baseline."""
+    matched: bool
+    diff_pixels: int = 0
+    antialiased_pixels: int = 0
+    diff_ratio: float = 0.0
+    hash_distance: int = 0
+    reason: str = ""
+    diff_path: Optional[pathlib.Path] = None
+
+
+@dataclass
+class _DecodedImage:
+    raw: bytes
+    pixels: 'np.ndarray'
+    phash: int
+
+
+def _require_dependencies() -> None:
+    if np is None or Image is None:
+        raise ImportError("Visual assertions require 'numpy' and 'Pillow': pip install numpy Pillow")
+
+
+def _decode(raw: bytes) -> _DecodedImage:
+    image = Image.open(io.BytesIO(raw)).convert("RGBA")
+    return _DecodedImage(raw=raw, pixels=np.asarray(image, dtype=np.int16), phash=_difference_hash(image))
+
+
+def _difference_hash(image: 'Image.Image') -> int:
+    """Perceptual difference hash: sign of horizontal gradients of a 9x8 grayscale thumbnail."""
+    thumbnail = np.asarray(image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR), dtype=np.int16)
+    bits = (thumbnail[:, 1:] > thumbnail[:, :-1]).flatten()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def _shift(pixels: 'np.ndarray', dy: int, dx: int) -> 'np.ndarray':
+    """Shift an image by (dy, dx), repeating the edge pixels."""
+    padded = np.pad(pixels, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    height, width = pixels.shape[:2]
+    return padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+
+def _close(first: 'np.ndarray', second: 'np.ndarray', tolerance: int) -> 'np.ndarray':
+    return np.abs(first - second).max(axis=2) <= tolerance
+
+
+def _antialiased(actual: 'np.ndarray', expected: 'np.ndarray', tolerance: int) -> 'np.ndarray':
+    """
+    Mark pixels whose color is found in the 3x3 neighbourhood of the other image.
+
+    Such differences come from anti-aliasing and sub-pixel rendering shifts, not from content changes.
+    """
+    found = np.zeros(actual.shape[:2], dtype=bool)
+    for dy, dx in _NEIGHBOURS:
+        found |= _close(actual, _shift(expected, dy, dx), tolerance)
+        found |= _close(expected, _shift(actual, dy, dx), tolerance)
+    return found
+
+
+class VisualComparator:
+    """
+    Compares screenshots to baseline images with vectorized NumPy operations.
+
+    Comparison steps, cheapest first:
+    identical encoded bytes pass immediately; a perceptual hash distance above
+    PHASH_MISMATCH_DISTANCE fails without the anti-aliasing analysis; otherwise a per-pixel
+    diff with tolerance is computed, ignore regions are masked out and differences caused by
+    anti-aliasing are discounted. Decoded baselines are cached in memory across tests and
+    diff images are written only on mismatch.
+
+    :param baseline_dir: Directory with baseline PNG files.
+    :param diff_dir: Directory for diff images of mismatches.
+    :param tolerance: Maximum per-channel difference (0-255) for pixels to be considered equal.
+    :param max_diff_ratio: Maximum share of different pixels for images to be considered equal.
+    :param detect_antialiasing: Discount differences caused by anti-aliasing.
+    """
+
+    _baselines: 'OrderedDict[pathlib.Path, Tuple[float, _DecodedImage]]' = OrderedDict()
+
+    def __init__(self, baseline_dir: pathlib.Path, diff_dir: pathlib.Path, tolerance: int = DEFAULT_TOLERANCE,
+                 max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO, detect_antialiasing: bool = True):
+        _require_dependencies()
+        self.baseline_dir = pathlib.Path(baseline_dir)
+        self.diff_dir = pathlib.Path(diff_dir)
+        self.tolerance = tolerance
+        self.max_diff_ratio = max_diff_ratio
+        self.detect_antialiasing = detect_antialiasing
+
+    def compare(self, name: str, screenshot: bytes, ignore_regions: Optional[List[Region]] = None) -> VisualDiff:
+        """
+        Compare a PNG screenshot to the baseline of the same name.
+
+        If no baseline exists, the screenshot is saved as the new baseline and the comparison passes.
+
+        :param name: Baseline name (without extension).
+        :param screenshot: PNG-encoded screenshot.
+        :param ignore_regions: Regions to ignore, as {'x', 'y', 'width', 'height'} in pixels.
+        :return: VisualDiff with the comparison result.
+        """
+        baseline_path = self.baseline_dir / f"{name}.png"
+        if not baseline_path.exists():
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_bytes(screenshot)
+            logger.warning(f"Baseline '{baseline_path}' did not exist and was created from the screenshot")
+            return VisualDiff(matched=True, reason="baseline created")
+
+        expected = self._load_baseline(baseline_path)
+        if screenshot == expected.raw:
+            return VisualDiff(matched=True, reason="identical")
+
+        actual = _decode(screenshot)
+        if actual.pixels.shape != expected.pixels.shape:
+            return self._mismatch(name, actual, expected, None, VisualDiff(
+                matched=False, reason=f"size {actual.pixels.shape[1::-1]} != {expected.pixels.shape[1::-1]}"))
+
+        hash_distance = bin(actual.phash ^ expected.phash).count("1")
+        diff_mask = ~_close(actual.pixels, expected.pixels, self.tolerance)
+        for region in ignore_regions or []:
+            diff_mask[region["y"]:region["y"] + region["height"], region["x"]:region["x"] + region["width"]] = False
+
+        antialiased_mask = None
+        if self.detect_antialiasing and hash_distance <= PHASH_MISMATCH_DISTANCE and diff_mask.any():
+            antialiased_mask = self._antialiased_in_bounds(actual.pixels, expected.pixels, diff_mask)
+            diff_mask &= ~antialiased_mask
+
+        diff_pixels = int(diff_mask.sum())
+        result = VisualDiff(
+            matched=diff_pixels / diff_mask.size <= self.max_diff_ratio,
+            diff_pixels=diff_pixels,
+            antialiased_pixels=int(antialiased_mask.sum()) if antialiased_mask is not None else 0,
+            diff_ratio=diff_pixels / diff_mask.size,
+            hash_distance=hash_distance,
+        )
+        if result.matched:
+            return result
+        result.reason = f"{diff_pixels} pixels ({result.diff_ratio:.4%}) differ"
+        return self._mismatch(name, actual, expected, (diff_mask, antialiased_mask), result)
+
+    def _antialiased_in_bounds(self, actual: 'np.ndarray', expected: 'np.ndarray',
+                               diff_mask: 'np.ndarray') -> 'np.ndarray':
+        """Run the anti-aliasing analysis only within the bounding box of the differences (plus 1px border)."""
+        rows, columns = np.nonzero(diff_mask.any(axis=1))[0], np.nonzero(diff_mask.any(axis=0))[0]
+        top, bottom = max(rows[0] - 1, 0), min(rows[-1] + 2, diff_mask.shape[0])
+        left, right = max(columns[0] - 1, 0), min(columns[-1] + 2, diff_mask.shape[1])
+
+        result = np.zeros(diff_mask.shape, dtype=bool)
+        window = _antialiased(actual[top:bottom, left:right], expected[top:bottom, left:right], self.tolerance)
+        result[top:bottom, left:right] = window & diff_mask[top:bottom, left:right]
+        return result
+
+    def _mismatch(self, name: str, actual: _DecodedImage, expected: _DecodedImage,
+                  masks: Optional[Tuple['np.ndarray', Optional['np.ndarray']]], result: VisualDiff) -> VisualDiff:
+        self.diff_dir.mkdir(parents=True, exist_ok=True)
+        result.diff_path = self.diff_dir / f"{name}.diff.png"
+        self.diff_dir.joinpath(f"{name}.actual.png").write_bytes(actual.raw)
+
+        if masks is None:
+            # Images of different size: the actual screenshot is the most useful artifact
+            result.diff_path = self.diff_dir / f"{name}.actual.png"
+        else:
+            diff_mask, antialiased_mask = masks
+            gray = expected.pixels[..., :3].mean(axis=2, keepdims=True)
+            canvas = np.concatenate([np.repeat(gray // 3 + 170, 3, axis=2),
+                                     np.full(gray.shape, 255, dtype=gray.dtype)], axis=2).astype(np.uint8)
+            if antialiased_mask is not None:
+                canvas[antialiased_mask] = ANTIALIASING_COLOR
+            canvas[diff_mask] = DIFF_COLOR
+            Image.fromarray(canvas, "RGBA").save(result.diff_path)
+
+        logger.error(f"Screenshot '{name}' does not match the baseline: {result.reason}. Diff: '{result.diff_path}'")
+        return result
+
+    @classmethod
+    def _load_baseline(cls, path: pathlib.Path) -> _DecodedImage:
+        mtime = path.stat().st_mtime
+        cached = cls._baselines.get(path)
+        if cached is not None and cached[0] == mtime:
+            cls._baselines.move_to_end(path)
+            return cached[1]
+
+        decoded = _decode(path.read_bytes())
+        cls._baselines[path] = (mtime, decoded)
+        if len(cls._baselines) > BASELINE_CACHE_SIZE:
+            cls._baselines.popitem(last=False)
+        return decoded
@@ -0,0 +1,98 @@
+import os
+import pathlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+PROC_DIR = pathlib.Path("/proc")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Process name of the Playwright driver, which is a child of the test runner but not part of a browser
+PLAYWRIGHT_DRIVER_NAMES = {"node"}
+
+
+@dataclass
+class ProcessInfo:
+    """Basic information about a running process read from /proc."""
+    pid: int
+    ppid: int
+    name: str
+    rss_bytes: int
+
+
+def is_supported() -> bool:
+    """Return True if process information can be read from /proc."""
+    return PROC_DIR.joinpath("self", "stat").exists()
+
+
+def _read_process(pid: int) -> Optional[ProcessInfo]:
+    try:
+        stat = PROC_DIR.joinpath(str(pid), "stat").read_text()
+        statm = PROC_DIR.joinpath(str(pid), "statm").read_text()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+
+    # The name is in parentheses and may contain spaces, so split after the last ')'
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    return ProcessInfo(pid=pid, ppid=int(fields[1]), name=name, rss_bytes=int(statm.split()[1]) * PAGE_SIZE)
+
+
+def iter_processes() -> Iterable[ProcessInfo]:
+    """Yield all processes visible in /proc."""
+    if not is_supported():
+        return
+    for entry in PROC_DIR.iterdir():
+        if entry.name.isdigit():
+            info = _read_process(int(entry.name))
+            if info is not None:
+                yield info
+
+
+def descendants(root_pid: int, processes: Optional[List[ProcessInfo]] = None) -> List[ProcessInfo]:
+    """
+    Return all descendant processes of the given process.
+
+    :param root_pid: PID of the root process.
+    :param processes: Process snapshot to use (read from /proc if omitted).
+    :return: List of descendant processes.
+    """
+    processes = list(iter_processes()) if processes is None else processes
+    children: Dict[int, List[ProcessInfo]] = {}
+    for info in processes:
+        children.setdefault(info.ppid, []).append(info)
+
+    result: List[ProcessInfo] = []
+    pending = [root_pid]
+    seen: Set[int] = set()
+    while pending:
+        pid = pending.pop()
+        for child in children.get(pid, []):
+            if child.pid not in seen:
+                seen.add(child.pid)
+                result.append(child)
+                pending.append(child.pid)
+    return result
+
+
+def browser_processes(root_pid: Optional[int] = None) -> List[ProcessInfo]:
+    """
+    Return the browser processes started by the test runner (excluding the Playwright driver).
+
+    :param root_pid: PID of the test runner (defaults to the current process).
+    :return: List of browser processes.
+    """
+    return [info for info in descendants(root_pid or os.getpid())
+            if info.name not in PLAYWRIGHT_DRIVER_NAMES]
+
+
+def browser_rss_bytes(root_pid: Optional[int] = None) -> Optional[int]:
+    """
+    Return the total resident memory of the browser processes started by the test runner.
+
+    :param root_pid: PID of the test runner (defaults to the current process).
+    :return: RSS in bytes, or None if /proc is not available.
+    """
+    if not is_supported():
+        return None
+    return sum(info.rss_bytes for info in browser_processes(root_pid))
+
@@ -0,0 +1,9 @@
+import pytest, time
+@pytest.fixture(scope="module")
+def browser(request):
+    return request.param if hasattr(request, "param") else "default"
+@pytest.mark.parametrize("x", [1, 2])
+def test_a(browser, x):
+    time.sleep(0.01 if browser != "firefox" else 0.03)
+def test_app(app_url):
+    assert app_url.startswith("http://127.0.0.1")